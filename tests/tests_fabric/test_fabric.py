@@ -20,7 +20,6 @@ from unittest.mock import ANY, MagicMock, Mock, PropertyMock, call
 import lightning.fabric
 import pytest
 import torch
-import torch.distributed
 import torch.nn.functional
 from lightning.fabric.fabric import Fabric
 from lightning.fabric.strategies import (
@@ -101,7 +101,6 @@ def run_model_test(
         trainer._checkpoint_connector.restore(checkpoint_path)
 
 
-@torch.no_grad()
 def run_model_prediction(trained_model, dataloader, min_acc=0.50):
     orig_device = trained_model.device
     # run prediction on 1 batch
@@ -112,9 +111,12 @@ def run_model_prediction(trained_model, dataloader, min_acc=0.50):
     x, y = batch
     x = x.flatten(1)
 
-    y_hat = trained_model(x)
-    metric = partial(accuracy, task="multiclass") if _TM_GE_0_11 else accuracy
-    acc = metric(y_hat.cpu(), y.cpu(), top_k=2, num_classes=y_hat.size(-1)).item()
+    # only the forward runs under inference mode: moving the module back to its device must not turn its parameters
+    # into inference tensors
+    with torch.inference_mode():
+        y_hat = trained_model(x)
+        metric = partial(accuracy, task="multiclass") if _TM_GE_0_11 else accuracy
+        acc = metric(y_hat.cpu(), y.cpu(), top_k=2, num_classes=y_hat.size(-1)).item()
 
     assert acc >= min_acc, f"This model is expected to get > {min_acc} in test set (it got {acc})"
     trained_model.to(orig_device)
@@ -31,21 +31,26 @@ def _patch_comet_atexit(monkeypatch):
 
 
 @mock.patch.dict(os.environ, {})
-def test_comet_logger_online(comet_mock):
-    """Test comet online with mocks."""
-    # Test api_key given
+def test_comet_logger_online_api_key(comet_mock):
+    """Test comet online with only the api key given."""
     comet_experiment = comet_mock.Experiment
     logger = CometLogger(api_key="key", workspace="dummy-test", project_name="general")
     _ = logger.experiment
     comet_experiment.assert_called_once_with(api_key="key", workspace="dummy-test", project_name="general")
 
-    # Test both given
-    comet_experiment.reset_mock()
+
+@mock.patch.dict(os.environ, {})
+def test_comet_logger_online_api_key_and_save_dir(comet_mock):
+    """Test comet online when both the api key and the save dir are given."""
+    comet_experiment = comet_mock.Experiment
     logger = CometLogger(save_dir="test", api_key="key", workspace="dummy-test", project_name="general")
     _ = logger.experiment
     comet_experiment.assert_called_once_with(api_key="key", workspace="dummy-test", project_name="general")
 
-    # Test already exists
+
+@mock.patch.dict(os.environ, {})
+def test_comet_logger_online_existing_experiment(comet_mock):
+    """Test comet online resumes an existing experiment when an experiment key is given."""
     comet_existing = comet_mock.ExistingExperiment
     logger = CometLogger(
         experiment_key="test",
@@ -60,7 +65,10 @@ def test_comet_logger_online(comet_mock):
     )
     comet_existing().set_name.assert_called_once_with("experiment")
 
-    # API experiment
+
+@mock.patch.dict(os.environ, {})
+def test_comet_logger_online_rest_api(comet_mock):
+    """Test comet online creates the REST API client when a rest api key is given."""
     api = comet_mock.api.API
     CometLogger(api_key="key", workspace="dummy-test", project_name="general", rest_api_key="rest")
     api.assert_called_once_with("rest")
@@ -70,18 +70,11 @@ class OutputMapping(Generic[T], Mapping[str, T]):
         (OutputMapping({"a": 5}), "the 'loss' key needs to be present"),
     ],
 )
-def test_warning_invalid_trainstep_output(tmp_path, case):
+def test_warning_invalid_trainstep_output(case):
     output, match = case
 
-    class InvalidTrainStepModel(BoringModel):
-        def training_step(self, batch, batch_idx):
-            return output
-
-    model = InvalidTrainStepModel()
-    trainer = Trainer(default_root_dir=tmp_path, fast_dev_run=1)
-
     with pytest.raises(MisconfigurationException, match=match):
-        trainer.fit(model)
+        ClosureResult.from_training_step_output(output)
 
 
 @pytest.mark.parametrize("world_size", [1, 2])
@@ -54,16 +54,12 @@ def test_cpu_slurm_save_load(_, tmp_path):
 
     # predict with trained model before saving
     # make a prediction
-    dataloaders = model.test_dataloader()
-    if not isinstance(dataloaders, list):
-        dataloaders = [dataloaders]
-
-    for dataloader in dataloaders:
-        for batch in dataloader:
-            break
+    dataloader = model.test_dataloader()
+    batch = next(iter(dataloader))
 
     model.eval()
-    pred_before_saving = model(batch)
+    with torch.inference_mode():
+        pred_before_saving = model(batch)
 
     # test HPC saving
     # simulate snapshot on slurm
@@ -87,8 +83,9 @@ def test_cpu_slurm_save_load(_, tmp_path):
             # predict with loaded model to make sure answers are the same
             mode = model.training
             model.eval()
-            new_pred = model(batch)
-            assert torch.eq(pred_before_saving, new_pred).all()
+            with torch.inference_mode():
+                new_pred = model(batch)
+            assert torch.equal(pred_before_saving, new_pred)
             model.train(mode)
 
     trainer = Trainer(
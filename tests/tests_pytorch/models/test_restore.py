@@ -345,16 +345,30 @@ def test_callbacks_references_fit_ckpt_path(tmp_path):
     trainer.fit(model, datamodule=dm, ckpt_path=str(tmp_path / "last.ckpt"))
 
 
-@RunIf(min_cuda_gpus=2, sklearn=True)
-def test_running_test_pretrained_model_distrib_ddp_spawn(tmp_path):
-    """Verify `test()` on pretrained model."""
+@pytest.mark.parametrize(
+    ("trainer_kwargs", "min_acc"),
+    [
+        pytest.param({}, 0.45, id="cpu"),
+        pytest.param(
+            {"accelerator": "gpu", "devices": [0, 1], "strategy": "ddp_spawn"},
+            0.1,
+            id="ddp_spawn",
+            marks=RunIf(min_cuda_gpus=2),
+        ),
+    ],
+)
+@RunIf(sklearn=True)
+def test_running_test_pretrained_model(tmp_path, trainer_kwargs, min_acc):
+    """Verify test() on pretrained model."""
+    seed_everything(1)
+
     dm = ClassifDataModule()
     model = ClassificationModel()
 
-    # exp file to get meta
+    # logger file to get meta
     logger = tutils.get_default_logger(tmp_path)
 
-    # exp file to get weights
+    # logger file to get weights
     checkpoint = tutils.init_checkpoint_callback(logger)
 
     trainer_options = {
@@ -362,12 +376,11 @@ def test_running_test_pretrained_model_distrib_ddp_spawn(tmp_path):
         "max_epochs": 2,
         "limit_train_batches": 2,
         "limit_val_batches": 2,
+        "limit_test_batches": 2,
         "callbacks": [checkpoint],
         "logger": logger,
-        "accelerator": "gpu",
-        "devices": [0, 1],
-        "strategy": "ddp_spawn",
         "default_root_dir": tmp_path,
+        **trainer_kwargs,
     }
 
     # fit model
@@ -385,6 +398,9 @@ def test_running_test_pretrained_model_distrib_ddp_spawn(tmp_path):
     new_trainer.test(pretrained_model, datamodule=dm)
     pretrained_model.cpu()
 
+    # test we have good test accuracy
+    tutils.assert_ok_model_acc(new_trainer, key="test_acc", thr=min_acc)
+
     dataloaders = dm.test_dataloader()
     if not isinstance(dataloaders, list):
         dataloaders = [dataloaders]
@@ -393,46 +409,6 @@ def test_running_test_pretrained_model_distrib_ddp_spawn(tmp_path):
         tpipes.run_model_prediction(pretrained_model, dataloader, min_acc=0.1)
 
 
-@RunIf(sklearn=True)
-def test_running_test_pretrained_model_cpu(tmp_path):
-    """Verify test() on pretrained model."""
-    seed_everything(1)
-
-    dm = ClassifDataModule()
-    model = ClassificationModel()
-
-    # logger file to get meta
-    logger = tutils.get_default_logger(tmp_path)
-
-    # logger file to get weights
-    checkpoint = tutils.init_checkpoint_callback(logger)
-
-    trainer_options = {
-        "enable_progress_bar": False,
-        "max_epochs": 2,
-        "limit_train_batches": 2,
-        "limit_val_batches": 2,
-        "limit_test_batches": 2,
-        "callbacks": [checkpoint],
-        "logger": logger,
-        "default_root_dir": tmp_path,
-    }
-
-    # fit model
-    trainer = Trainer(**trainer_options)
-    trainer.fit(model, datamodule=dm)
-
-    # correct result and ok accuracy
-    assert trainer.state.finished, f"Training failed with {trainer.state}"
-    pretrained_model = ClassificationModel.load_from_checkpoint(trainer.checkpoint_callback.best_model_path)
-
-    new_trainer = Trainer(**trainer_options)
-    new_trainer.test(pretrained_model, datamodule=dm)
-
-    # test we have good test accuracy
-    tutils.assert_ok_model_acc(new_trainer, key="test_acc", thr=0.45)
-
-
 @pytest.mark.parametrize("model_template", [ValTestLossBoringModel, GenericValTestLossBoringModel])
 def test_load_model_from_checkpoint(tmp_path, model_template):
     """Verify test() on pretrained model."""
@@ -504,7 +480,8 @@ def test_model_saving_loading(tmp_path):
 
     # generate preds before saving model
     model.eval()
-    pred_before_saving = model(batch)
+    with torch.inference_mode():
+        pred_before_saving = model(batch)
 
     # save model
     new_weights_path = os.path.join(tmp_path, "save_test.ckpt")
@@ -518,8 +495,9 @@ def test_model_saving_loading(tmp_path):
 
     # make prediction
     # assert that both predictions are the same
-    new_pred = model_2(batch)
-    assert torch.all(torch.eq(pred_before_saving, new_pred)).item() == 1
+    with torch.inference_mode():
+        new_pred = model_2(batch)
+    assert torch.equal(pred_before_saving, new_pred)
 
 
 @pytest.mark.parametrize("url_ckpt", [True, False])
@@ -77,11 +77,13 @@ def test_model_tpu_index(tmp_path, tpu_core):
     assert torch_xla._XLAC._xla_get_default_device() == f"xla:{tpu_core}"
 
 
+@pytest.mark.parametrize("precision", ["32-true", "16-true"])
 @RunIf(tpu=True, standalone=True)
 @mock.patch.dict(os.environ, os.environ.copy(), clear=True)
-def test_model_multiple_tpu_devices(tmp_path):
+def test_model_multiple_tpu_devices(tmp_path, precision):
     trainer_options = {
         "default_root_dir": tmp_path,
+        "precision": precision,
         "enable_progress_bar": False,
         "max_epochs": 1,
         "accelerator": "tpu",
@@ -135,25 +137,6 @@ def test_model_16bit_tpu_index(tmp_path, tpu_core):
     assert torch_xla._XLAC._xla_get_default_device() == f"xla:{tpu_core}"
 
 
-@RunIf(tpu=True, standalone=True)
-@mock.patch.dict(os.environ, os.environ.copy(), clear=True)
-def test_model_16bit_multiple_tpu_devices(tmp_path):
-    trainer_options = {
-        "default_root_dir": tmp_path,
-        "precision": "16-true",
-        "enable_progress_bar": False,
-        "max_epochs": 1,
-        "accelerator": "tpu",
-        "devices": "auto",
-        "limit_train_batches": 3,
-        "limit_val_batches": 3,
-    }
-
-    # multiple cores needs a big dataset
-    model = SerialLoaderBoringModel()
-    tpipes.run_model_test(trainer_options, model, with_hpc=False, min_acc=0.05)
-
-
 class CustomBoringModel(BoringModel):
     def validation_step(self, *args, **kwargs):
         out = super().validation_step(*args, **kwargs)
@@ -189,8 +172,8 @@ def test_tpu_grad_norm(tmp_path):
         "max_epochs": 4,
         "accelerator": "tpu",
         "devices": 1,
-        "limit_train_batches": 0.4,
-        "limit_val_batches": 0.4,
+        "limit_train_batches": 3,
+        "limit_val_batches": 3,
         "gradient_clip_val": 0.5,
     }
 
@@ -289,7 +272,7 @@ def xla_launch(fn):
 
 def tpu_sync_dist_fn(strategy):
     sync = _Sync(strategy.reduce, _should=True, _op=torch.distributed.ReduceOp.SUM)
-    value = torch.tensor([1.0])
+    value = torch.tensor([1.0], device=strategy.root_device)
     value = sync(value)
     assert value.item() == strategy.world_size
 
@@ -319,8 +302,8 @@ def test_tpu_debug_mode(tmp_path):
         "max_epochs": 4,
         "accelerator": "tpu",
         "devices": "auto",
-        "limit_train_batches": 0.4,
-        "limit_val_batches": 0.4,
+        "limit_train_batches": 3,
+        "limit_val_batches": 3,
         "strategy": XLAStrategy(debug=True),
     }
 
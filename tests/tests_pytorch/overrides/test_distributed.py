@@ -60,15 +60,8 @@ def test_unrepeated_distributed_sampler(shuffle):
         samplers.append(UnrepeatedDistributedSampler(dataset, rank=rank, num_replicas=world_size, shuffle=shuffle))
 
     indices = [list(s) for s in samplers]
-    assert len(indices[0]) == 26
-    assert len(indices[1]) == 26
-    assert len(indices[2]) == 26
-    assert len(indices[3]) == 25
-
-    assert indices[0][-1] == 18 if shuffle else 100
-    assert indices[1][-1] == 30 if shuffle else 101
-    assert indices[2][-1] == 29 if shuffle else 102
-    assert indices[3][-1] == 35 if shuffle else 99
+    assert [len(i) for i in indices] == [26, 26, 26, 25]
+    assert [i[-1] for i in indices] == ([18, 30, 29, 35] if shuffle else [100, 101, 102, 99])
 
 
 def test_index_batch_sampler():
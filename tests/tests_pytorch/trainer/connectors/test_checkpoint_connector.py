@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import shutil
 from unittest import mock
 from unittest.mock import ANY, Mock
 
@@ -92,9 +93,9 @@ def test_hpc_max_ckpt_version(tmp_path):
     trainer = Trainer(default_root_dir=tmp_path, max_steps=1)
     trainer.fit(model)
     trainer.save_checkpoint(tmp_path / "hpc_ckpt.ckpt")
-    trainer.save_checkpoint(tmp_path / "hpc_ckpt_0.ckpt")
-    trainer.save_checkpoint(tmp_path / "hpc_ckpt_3.ckpt")
-    trainer.save_checkpoint(tmp_path / "hpc_ckpt_33.ckpt")
+    # only the file names matter for the version lookup
+    for version in (0, 3, 33):
+        shutil.copyfile(tmp_path / "hpc_ckpt.ckpt", tmp_path / f"hpc_ckpt_{version}.ckpt")
 
     assert trainer._checkpoint_connector._hpc_resume_path == str(tmp_path / "hpc_ckpt_33.ckpt")
     assert trainer._checkpoint_connector._CheckpointConnector__max_ckpt_version_in_folder(tmp_path) == 33
@@ -158,14 +159,10 @@ def test_loops_restore(tmp_path):
         trainer._checkpoint_connector.resume_start(ckpt_path)
         trainer._checkpoint_connector.restore_loops()
 
-        trainer_loop = getattr(trainer, f"{fn.value}_loop")
-        trainer_loop.load_state_dict.assert_called()
-        trainer_loop.load_state_dict.reset_mock()
-
-        for fn2 in trainer_fns:
-            if fn2 != fn:
-                trainer_loop2 = getattr(trainer, f"{fn2.value}_loop")
-                trainer_loop2.load_state_dict.assert_not_called()
+        # only the loop of the current trainer function gets restored
+        restored = [fn2 for fn2 in trainer_fns if getattr(trainer, f"{fn2.value}_loop").load_state_dict.called]
+        assert restored == [fn]
+        getattr(trainer, f"{fn.value}_loop").load_state_dict.reset_mock()
 
 
 def test_stateful_trainer_ckpt_path_support(tmp_path):
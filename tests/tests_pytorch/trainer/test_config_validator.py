@@ -47,7 +47,7 @@ def test_wrong_configure_optimizers(tmp_path):
 
 def test_fit_val_loop_config(tmp_path):
     """When either val loop or val data are missing raise warning."""
-    trainer = Trainer(default_root_dir=tmp_path, max_epochs=1)
+    trainer = Trainer(default_root_dir=tmp_path, fast_dev_run=True)
 
     # no val data has val loop
     with pytest.warns(UserWarning, match=r"You passed in a `val_dataloader` but have no `validation_step`"):
@@ -38,11 +38,14 @@ def all_gather_ddp_spawn_fn(strategy):
     tensor1_gathered.sum().backward()
     tensor2_gathered.sum().backward()
 
-    grad1 = torch.zeros_like(tensor1.grad).fill_(torch.arange(world_size).sum().float())
-    grad2 = torch.zeros_like(tensor2.grad).fill_(torch.arange(world_size).sum().float())
+    # every rank scales the whole gathered tensor by its own rank, so after the `sync_grads` reduction each input's
+    # gradient is 0 + 1 + ... + (world_size - 1) on all ranks
+    expected = world_size * (world_size - 1) / 2
+    grad1 = torch.full_like(tensor1.grad, expected)
+    grad2 = torch.full_like(tensor2.grad, expected)
 
-    assert torch.allclose(grad1, tensor1.grad)
-    assert torch.allclose(grad2, tensor2.grad)
+    assert torch.equal(grad1, tensor1.grad)
+    assert torch.equal(grad2, tensor2.grad)
 
 
 @RunIf(skip_windows=True)
@@ -88,11 +91,10 @@ def test_all_gather_collection(tmp_path):
     model = TestModel()
     trainer = Trainer(
         default_root_dir=tmp_path,
-        limit_train_batches=8,
+        limit_train_batches=1,
         limit_val_batches=0,
         max_epochs=1,
         log_every_n_steps=1,
-        accumulate_grad_batches=2,
         accelerator="gpu",
         devices=2,
         strategy="ddp",